@@ -22,12 +22,18 @@ class CustomBuildHook(BuildHookInterface):
 
         print(f"Building libmseed via Makefile in {self.libmseed_path}")
 
+        env = os.environ.copy()
+
         if sys.platform.lower().startswith("win"):
             cmd = f"nmake /f Makefile.win dll"
         else:
-            cmd = f"CFLAGS='-O3' make -j shared"
+            cmd = f"make -j shared"
+
+            # Default to portable optimization, allow override for specialized builds,
+            # e.g. CFLAGS='-O3 -march=native -flto' LDFLAGS='-flto'
+            env['CFLAGS'] = os.environ.get('CFLAGS', '-O3')
 
-        subprocess.check_call(cmd, cwd=self.libmseed_path, shell=True)
+        subprocess.check_call(cmd, cwd=self.libmseed_path, shell=True, env=env)
 
         # Copy shared library to root package location
         if os.path.exists(os.path.join(self.libmseed_path, 'libmseed.so')):
@@ -1,9 +1,11 @@
 import os
+import functools
 
 # Package version
 __version__ = '0.0.6'
 
 
+@functools.cache
 def libmseed_version():
     """Return the version of libmseed used by this module"""
     module_path = os.path.abspath(os.path.dirname(__file__))
@@ -1,5 +1,4 @@
 import os
-import ctypes as ct
 from enum import IntEnum
 
 # Some common definitions from libmseed.h needed by the module
@@ -23,20 +22,20 @@ MS_STBADCOMPFLAG = -6  # Steim, invalid compression flag(s)
 MS_INVALIDCRC = -7  # Invalid CRC
 
 # Flags for reading and writing miniSEED
-MSF_UNPACKDATA = ct.c_uint32(0x0001)  # [Parsing] Unpack data samples
-MSF_SKIPNOTDATA = ct.c_uint32(0x0002)  # [Parsing] Skip input that cannot be identified as miniSEED
-MSF_VALIDATECRC = ct.c_uint32(0x0004)  # [Parsing] Validate CRC (if version 3)
-MSF_PNAMERANGE = ct.c_uint32(0x0008)  # [Parsing] Parse and utilize byte range from path name suffix
-MSF_ATENDOFFILE = ct.c_uint32(0x0010)  # [Parsing] Reading routine is at the end of the file
-MSF_SEQUENCE = ct.c_uint32(0x0020)  # [Packing] UNSUPPORTED: Maintain a record-level sequence number
-MSF_FLUSHDATA = ct.c_uint32(0x0040)  # [Packing] Pack all available data even if final record would not be filled
-MSF_PACKVER2 = ct.c_uint32(0x0080)  # [Packing] Pack as miniSEED version 2 instead of 3
-MSF_RECORDLIST = ct.c_uint32(0x0100)  # [TraceList] Build a ::MS3RecordList for each ::MS3TraceSeg
-MSF_MAINTAINMSTL = ct.c_uint32(0x0200)  # [TraceList] Do not modify a trace list when packing
+MSF_UNPACKDATA = 0x0001  # [Parsing] Unpack data samples
+MSF_SKIPNOTDATA = 0x0002  # [Parsing] Skip input that cannot be identified as miniSEED
+MSF_VALIDATECRC = 0x0004  # [Parsing] Validate CRC (if version 3)
+MSF_PNAMERANGE = 0x0008  # [Parsing] Parse and utilize byte range from path name suffix
+MSF_ATENDOFFILE = 0x0010  # [Parsing] Reading routine is at the end of the file
+MSF_SEQUENCE = 0x0020  # [Packing] UNSUPPORTED: Maintain a record-level sequence number
+MSF_FLUSHDATA = 0x0040  # [Packing] Pack all available data even if final record would not be filled
+MSF_PACKVER2 = 0x0080  # [Packing] Pack as miniSEED version 2 instead of 3
+MSF_RECORDLIST = 0x0100  # [TraceList] Build a ::MS3RecordList for each ::MS3TraceSeg
+MSF_MAINTAINMSTL = 0x0200  # [TraceList] Do not modify a trace list when packing
 
 # Byte swap flag
-MSSWAP_HEADER = ct.c_uint8(0x01)  # Header needed byte swapping
-MSSWAP_PAYLOAD = ct.c_uint8(0x02)  # Data payload needed byte swapping
+MSSWAP_HEADER = 0x01  # Header needed byte swapping
+MSSWAP_PAYLOAD = 0x02  # Data payload needed byte swapping
 
 
 class ctypesEnum(IntEnum):
@@ -1,8 +1,9 @@
 import ctypes as ct
-import json
+from typing import Any
 from .clib import clibmseed, wrap_function
 from .definitions import *
-from .util import ms_nstime2timestr, ms_timestr2nstime, ms_encodingstr
+from .util import (ms_timestr2nstime, ms_encodingstr, _nstime2str, _sample_array, _np_view,
+                   _SAMPLETYPE_CTYPE)
 from .exceptions import *
 
 
@@ -35,8 +36,9 @@ class MS3Record(ct.Structure):
     def __repr__(self) -> str:
         datasamples_str = '[]'
         if self._numsamples > 0:
-          samples = self.datasamples
-          datasamples_str = str(samples[:5]) + ' ...' if len(samples) > 5 else str(samples)
+            datasamples_str = str(self.datasamples[:5])
+            if self._numsamples > 5:
+                datasamples_str += ' ...'
 
         return (f'MS3Record(sourceid: {self._sid}\n'
                 f'        pubversion: {self._pubversion}\n'
@@ -93,16 +95,7 @@ class MS3Record(ct.Structure):
 
     def swapflag_dict(self) -> dict:
         '''Return swap flags as dictionary'''
-        swapflag = {}
-        if self._swapflag & MSSWAP_HEADER.value:
-            swapflag['header_swapped'] = True
-        else:
-            swapflag['header_swapped'] = False
-        if self._swapflag & MSSWAP_PAYLOAD.value:
-            swapflag['payload_swapped'] = True
-        else:
-            swapflag['payload_swapped'] = False
-        return swapflag
+        return {name: bool(self._swapflag & bit) for bit, name in _swapflag_names}
 
     @property
     def sourceid(self) -> str:
@@ -147,14 +140,7 @@ class MS3Record(ct.Structure):
 
     def flags_dict(self) -> dict:
         '''Return record flags as a dictionary'''
-        flags = {}
-        if self._flags & ct.c_uint8(0x01).value:
-            flags['calibration_signals_present'] = True
-        if self._flags & ct.c_uint8(0x02).value:
-            flags['time_tag_is_questionable'] = True
-        if self._flags & ct.c_uint8(0x04).value:
-            flags['clock_locked'] = True
-        return flags
+        return {name: True for bit, name in _flag_names if self._flags & bit}
 
     @property
     def starttime(self) -> int:
@@ -183,11 +169,7 @@ class MS3Record(ct.Structure):
 
     def starttime_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
         '''Return start time as formatted string'''
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self._starttime, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self._starttime, timeformat, subsecond)
 
     def set_starttime_str(self, value) -> None:
         '''Set the start time using the specified provided date-time string'''
@@ -295,34 +277,55 @@ class MS3Record(ct.Structure):
 
             data_samples = MS3Record.datasamples[:]
 
-        The array can efficiently be copied to a _numpy array_ using:
+        A zero-copy _numpy array_ of the samples is available as
+        `MS3Record.np_datasamples`.
+
+        *NOTE* These data are owned by the this object instance and will be freed
+        when the instance is destroyed.  If you wish to keep the data, you must
+        make a copy.
+        '''
+        numsamples = self.numsamples
+        if numsamples <= 0:
+            raise ValueError("No decoded samples available")
+
+        # Return the cached array if it describes the same samples
+        cache_key = (self._datasamples, numsamples, self._sampletype)
+        cached = self.__dict__.get('_datasamples_cache')
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        sampletype = self.sampletype
+        try:
+            ctype = _SAMPLETYPE_CTYPE[sampletype]
+        except KeyError:
+            raise ValueError(f"Unknown sample type: {sampletype}")
+
+        samples = (ctype * numsamples).from_address(self._datasamples)
+
+        self._datasamples_cache = (cache_key, samples)
 
-            # Translate libmseed sample type to numpy type
-            nptype = {'i': numpy.int32, 'f': numpy.float32, 'd': numpy.float64, 't': numpy.char}
+        return samples
 
-            numpy.frombuffer(MS3Record.datasamples, dtype=nptype[MS3Record.sampletype])
+    def datasamples_view(self) -> memoryview:
+        '''Return data samples as a memoryview of type `MS3Record.sampletype`
+
+        The returned view is zero-copy and can be indexed, sliced or passed to
+        any consumer of the buffer protocol, e.g. `array.array` or `numpy.asarray`.
 
         *NOTE* These data are owned by the this object instance and will be freed
         when the instance is destroyed.  If you wish to keep the data, you must
         make a copy.
         '''
-        if self.numsamples <= 0:
-            raise ValueError("No decoded samples available")
+        return memoryview(self.datasamples).cast('B').cast(_memoryview_formats[self.sampletype])
 
-        if self.sampletype == 'i':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_int32 * self.numsamples)).contents
-        elif self.sampletype == 'f':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_float * self.numsamples)).contents
-        elif self.sampletype == 'd':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_double * self.numsamples)).contents
-        elif self.sampletype == 't':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_char * self.numsamples)).contents
-        else:
-            raise ValueError(f"Unknown sample type: {self.sampletype}")
+    @property
+    def np_datasamples(self) -> Any:
+        '''Return data samples as a read-only numpy view of `MS3Record.datasamples`
+
+        NumPy is required for this property.  The view shares the memory of
+        `MS3Record.datasamples` and is subject to the same lifetime.
+        '''
+        return _np_view(self.datasamples, self.sampletype, 'MS3Record.np_datasamples')
 
     @property
     def datasize(self) -> int:
@@ -351,15 +354,16 @@ class MS3Record(ct.Structure):
 
     def endtime_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
         '''Return start time as formatted string'''
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self.endtime, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self.endtime, timeformat, subsecond)
 
     def encoding_str(self) -> str:
         '''Return encoding format as descriptive string'''
-        return ms_encodingstr(self._encoding).decode('utf-8')
+        try:
+            return _encoding_strings[self._encoding]
+        except KeyError:
+            encoding_string = ms_encodingstr(self._encoding).decode('utf-8')
+            _encoding_strings[self._encoding] = encoding_string
+            return encoding_string
 
     def print(self, details=0) -> None:
         '''Print details of the record to stdout, with varying levels of `details`'''
@@ -369,9 +373,9 @@ class MS3Record(ct.Structure):
         '''Callback function for msr3_pack()
         Ignore the handlerdata argument, which is passed at the Python level.
 
-        Cast the record buffer to a ctypes array for use in Python and pass to handler.
+        Map the record buffer address to a ctypes array for use in Python and pass to handler.
         '''
-        self._record_handler(ct.cast(record, ct.POINTER((ct.c_char * record_length))).contents,
+        self._record_handler((ct.c_char * record_length).from_address(record),
                              self._record_handler_data)
 
     def pack(self, handler, handlerdata=None, datasamples=None, sampletype=None,
@@ -384,10 +388,22 @@ class MS3Record(ct.Structure):
                 handlerdata:    The `handlerdata` value
 
         The handler function must use or copy the record buffer as the memory may be
-        reused on subsequent iterations.
+        reused on subsequent iterations.  The record is a ctypes array that supports
+        the buffer protocol, so it can be passed directly to `file.write()`,
+        `memoryview()` or `numpy.frombuffer()` without first copying it to `bytes`.
+
+        The `handler` may also be a ctypes function pointer of the prototype
+        `ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)`,
+        e.g. created from the address of a natively compiled function, in which
+        case it is called directly by the library as
+        `handler(record, record_length, handlerdata)` without the Python-level
+        wrapper.  The `handlerdata` must then be None, an integer
+        address or a ctypes pointer.
 
         If `datasamples` is not None, it must be a sequence of samples that can be
         packed into the type specified by `sampletype` and appropriate for MS3Record.encoding.
+        Buffers of matching native type, e.g. array.array('i') or a numpy int32 array
+        for sample type 'i', are used without per-sample conversion.
         If `datasamples` is None, any samples associated with the MS3Record will be packed.
 
         For more flexible packing of records, including multiple channels and rolling
@@ -396,20 +412,24 @@ class MS3Record(ct.Structure):
         Returns a tuple of (packed_samples, packed_records)
         '''
 
-        # Set hander function as ctypes callback function
-        if not hasattr(self, '_record_handler') or (self._record_handler != handler):
-            self._record_handler = handler
-
-            RECORD_HANDLER = ct.CFUNCTYPE(None, ct.POINTER(ct.c_char), ct.c_int, ct.c_void_p)
-            self._ctypes_record_handler = RECORD_HANDLER(self._record_handler_wrapper)
+        # Pass ctypes function pointers directly to the library
+        if isinstance(handler, _RECORD_HANDLER):
+            c_handler = handler
+            c_handlerdata = handlerdata
+        else:
+            # Create the ctypes callback once, it dispatches to the current handler
+            if not hasattr(self, '_ctypes_record_handler'):
+                self._ctypes_record_handler = _RECORD_HANDLER(self._record_handler_wrapper)
 
-        self._record_handler_data = handlerdata
+            self._record_handler = handler
+            self._record_handler_data = handlerdata
+            c_handler = self._ctypes_record_handler
+            c_handlerdata = None
 
-        pack_flags = ct.c_uint32(0)
         packed_samples = ct.c_int64(0)
 
         # Always flush data when packing
-        pack_flags.value |= MSF_FLUSHDATA.value
+        pack_flags = MSF_FLUSHDATA
 
         if datasamples is not None:
             msr_datasamples = self._datasamples
@@ -417,18 +437,8 @@ class MS3Record(ct.Structure):
             msr_numsamples = self._numsamples
             msr_samplecnt = self._samplecnt
 
-            len_datasamples = len(datasamples)
-
-            if sampletype == 'i':
-                ctypes_data = (ct.c_int32 * len_datasamples)(*datasamples)
-            elif sampletype == 'f':
-                ctypes_data = (ct.c_float * len_datasamples)(*datasamples)
-            elif sampletype == 'd':
-                ctypes_data = (ct.c_double * len_datasamples)(*datasamples)
-            elif sampletype == 't':
-                ctypes_data = (ct.c_char * len_datasamples)(*datasamples)
-            else:
-                raise ValueError(f"Unknown sample type: {sampletype}")
+            ctypes_data = _sample_array(datasamples, sampletype)
+            len_datasamples = len(ctypes_data)
 
             self._datasamples = ct.cast(ct.byref(ctypes_data), ct.c_void_p)
             self._sampletype = bytes(sampletype, 'utf-8')
@@ -438,18 +448,15 @@ class MS3Record(ct.Structure):
         # Retain miniSEED "sequence number" if parsed record is v2
         if self.formatversion == 2 and self._record:
             # Extract sequence number from record, first 6 bytes are ASCII digits
-            sequence_string = self._record[0:6].decode('utf-8')
-            sequence_number = int(sequence_string)
-
-            if self.extralength > 0:
-                extra_headers = json.loads(self.extra)
-                extra_headers.setdefault('FDSN', {})['Sequence'] = sequence_number
-                self.extra = json.dumps(extra_headers, separators=(',', ':'))
-            else:
-                extra_headers = {'FDSN': {'Sequence': sequence_number}}
-                self.extra = json.dumps(extra_headers, separators=(',', ':'))
-
-        packed_records = _msr3_pack(ct.byref(self), self._ctypes_record_handler, None,
+            sequence_number = int(self._record[0:6])
+
+            status = _mseh_set_ptr_r(ct.byref(self), b'/FDSN/Sequence',
+                                     ct.byref(ct.c_int64(sequence_number)), b'i', None)
+
+            if status < 0:
+                raise MseedLibError(status, f'Error setting sequence number extra header')
+
+        packed_records = _msr3_pack(ct.byref(self), c_handler, c_handlerdata,
                                     ct.byref(packed_samples), pack_flags, verbose)
 
         # Restore the original datasamples, stampletype, numsamples, samplecnt
@@ -465,6 +472,23 @@ class MS3Record(ct.Structure):
         return (packed_samples.value, packed_records)
 
 
+# memoryview formats for sample type codes
+_memoryview_formats = {'i': 'i', 'f': 'f', 'd': 'd', 't': 'c'}
+
+# Record flag and swap flag bits with their dictionary keys
+_flag_names = ((0x01, 'calibration_signals_present'),
+               (0x02, 'time_tag_is_questionable'),
+               (0x04, 'clock_locked'))
+
+_swapflag_names = ((MSSWAP_HEADER, 'header_swapped'),
+                   (MSSWAP_PAYLOAD, 'payload_swapped'))
+
+# Cache of encoding descriptions from ms_encodingstr(), keyed by encoding code
+_encoding_strings = {}
+
+# Callback prototype for record handlers passed to msr3_pack() and mstl3_pack()
+_RECORD_HANDLER = ct.CFUNCTYPE(None, ct.c_void_p, ct.c_int, ct.c_void_p)
+
 # Module-level C-function wrappers
 _msr3_sampratehz = wrap_function(clibmseed, 'msr3_sampratehz', ct.c_double,
                                  [ct.POINTER(MS3Record)])
@@ -478,6 +502,10 @@ _msr3_endtime = wrap_function(clibmseed, 'msr3_endtime', ct.c_int64,
 _mseh_replace = wrap_function(clibmseed, 'mseh_replace', ct.c_int,
                               [ct.POINTER(MS3Record), ct.c_char_p])
 
+_mseh_set_ptr_r = wrap_function(clibmseed, 'mseh_set_ptr_r', ct.c_int,
+                                [ct.POINTER(MS3Record), ct.c_char_p, ct.c_void_p,
+                                 ct.c_char, ct.c_void_p])
+
 _msr3_pack = wrap_function(clibmseed, 'msr3_pack', ct.c_int,
                            [ct.POINTER(MS3Record), ct.c_void_p, ct.c_void_p,
                             ct.POINTER(ct.c_int64),
@@ -2,16 +2,26 @@ import ctypes as ct
 from .clib import clibmseed, wrap_function
 from .definitions import *
 from .exceptions import *
-from .msrecord import MS3Record
+from .msrecord_reader import _MS3RecordIterator
 
 
-class MS3RecordBufferReader():
+class MS3RecordBufferReader(_MS3RecordIterator):
     """Read miniSEED records from a buffer, i.e. bytearray or numpy.array
 
     The `source` object must be support the writeable buffer interface
     for use with the ctypes interface without making a copy, but this
     class will not modify the buffer.
 
+    A memory-mapped file opened with `mmap.ACCESS_COPY` is a suitable
+    source, allowing records to be parsed directly from the page cache
+    without first reading the file into memory.  The map can be closed
+    once this reader is closed.
+
+    The buffer is only exported for the duration of each read, so a growing
+    source, e.g. a bytearray that is extended as data arrive, may be resized
+    between reads.  A read that finds an incomplete record at the end of the
+    source returns None and can be retried after more data are added.
+
     If `unpack_data` is True, the data samples will be decoded.
 
     If `validate_crc` is True, the CRC will be validated if contained in
@@ -22,50 +32,36 @@ class MS3RecordBufferReader():
     def __init__(self, source, unpack_data=False, validate_crc=True, verbose=0):
         super().__init__()
 
-        self._msr = ct.c_void_p(None)
+        self._msr_ref = ct.byref(self._msr)
         self.source = source
         self.source_offset = 0
-        self.parse_flags = ct.c_uint32(0)
+        self.parse_flags = ct.c_uint32((MSF_UNPACKDATA if unpack_data else 0) |
+                                       (MSF_VALIDATECRC if validate_crc else 0))
         self.verbose = ct.c_int8(verbose)
 
-        if unpack_data:
-            self.parse_flags.value |= MSF_UNPACKDATA.value
-
-        if validate_crc:
-            self.parse_flags.value |= MSF_VALIDATECRC.value
-
-        self.msr3_parse = wrap_function(clibmseed, 'msr3_parse', ct.c_int,
-                                                   [ct.POINTER(ct.c_char), ct.c_uint64,
-                                                    ct.POINTER(ct.c_void_p),
-                                                    ct.c_uint32, ct.c_int8])
+    def __length_hint__(self):
+        '''Estimate the number of remaining records assuming 512-byte records'''
+        if self.source is None:
+            return 0
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.close()
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        next = self.read()
-        if next is not None:
-            return next
-        else:
-            raise StopIteration
+        return max(0, (len(self.source) - self.source_offset) // 512)
 
     def read(self):
+        if self.source is None:
+            return None
+
         remaining_bytes = len(self.source) - self.source_offset
         if remaining_bytes <= 40:
             return None
 
-        status = self.msr3_parse((ct.c_char * (remaining_bytes)).from_buffer(self.source, self.source_offset),
-                                 remaining_bytes, ct.byref(self._msr),
-                                 self.parse_flags, self.verbose)
+        # Export the source at the current offset for this parse only, released on return
+        source_start = ct.c_char.from_buffer(self.source, self.source_offset)
+
+        status = _msr3_parse(ct.addressof(source_start), remaining_bytes, self._msr_ref,
+                             self.parse_flags, self.verbose)
 
         if status == MS_NOERROR:
-            msr = ct.cast(self._msr, ct.POINTER(MS3Record)).contents
+            msr = self._record()
             self.source_offset += msr.reclen
             return msr
         elif status > 0:  # Record detected but not enough data
@@ -73,8 +69,23 @@ class MS3RecordBufferReader():
         else:
             raise MseedLibError(status, f'Error reading miniSEED record')
 
+    def _at_end(self) -> bool:
+        '''Return True if the source is consumed, otherwise it may still grow'''
+        return self.source is None or self.source_offset >= len(self.source)
+
     def close(self) -> None:
-        _msr3_free = wrap_function(clibmseed, 'msr3_free', None,
-                                   [ct.POINTER(ct.c_void_p)])
-        _msr3_free(ct.byref(self._msr))
-        pass
+        _msr3_free(self._msr_ref)
+        self._msrecord = None
+
+        # Drop the source buffer, no further records will be read
+        self.source = None
+
+
+# Module-level C-function wrappers
+_msr3_parse = wrap_function(clibmseed, 'msr3_parse', ct.c_int,
+                            [ct.c_void_p, ct.c_uint64,
+                             ct.POINTER(ct.c_void_p),
+                             ct.c_uint32, ct.c_int8])
+
+_msr3_free = wrap_function(clibmseed, 'msr3_free', None,
+                           [ct.POINTER(ct.c_void_p)])
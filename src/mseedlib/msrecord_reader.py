@@ -1,3 +1,4 @@
+import os
 import sys
 import ctypes as ct
 from .clib import clibmseed, wrap_function
@@ -6,7 +7,57 @@ from .exceptions import *
 from .msrecord import MS3Record
 
 
-class MS3RecordReader():
+class _MS3RecordIterator():
+    """Iteration and record access shared by the miniSEED record readers
+
+    Subclasses implement read(), returning None when no record is available,
+    and _at_end() to report if that None marks the end of the input.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self._msr = ct.c_void_p(None)
+        self._msrecord = None
+        self._exhausted = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._exhausted:
+            raise StopIteration
+
+        next = self.read()
+        if next is not None:
+            return next
+        else:
+            self._exhausted = self._at_end()
+            raise StopIteration
+
+    def _at_end(self) -> bool:
+        '''Return True if a None from read() means no more records will follow'''
+        return True
+
+    def _record(self) -> MS3Record:
+        '''Return an MS3Record for the current C-level record
+
+        The library re-uses the same record structure for each read, so the
+        MS3Record is only rebuilt when the underlying address changes.
+        '''
+        if self._msrecord is None or ct.addressof(self._msrecord) != self._msr.value:
+            self._msrecord = MS3Record.from_address(self._msr.value)
+
+        return self._msrecord
+
+
+class MS3RecordReader(_MS3RecordIterator):
     """Read miniSEED records from a file or file descriptor
 
     If `input` is an integer, it is assumed to be an open file descriptor,
@@ -21,6 +72,11 @@ class MS3RecordReader():
     If `validate_crc` is True, the CRC will be validated if contained in
     the record (legacy miniSEED v2 contains no CRCs).  The CRC provides an
     internal integrity check of the record contents.
+
+    Calls into libmseed are made through ctypes, which releases the GIL for
+    the duration of each call.  The reading, CRC validation and decoding done
+    by separate readers in different threads can therefore overlap.  A single
+    reader must not be shared between threads.
     """
 
     def __init__(self, input, unpack_data=False, skip_not_data=False,
@@ -28,34 +84,25 @@ class MS3RecordReader():
         super().__init__()
 
         self._msfp = ct.c_void_p(None)
-        self._msr = ct.c_void_p(None)
         self._selections = ct.c_void_p()
-        self.parse_flags = ct.c_uint32(0)
+        self.parse_flags = ct.c_uint32((MSF_UNPACKDATA if unpack_data else 0) |
+                                       (MSF_SKIPNOTDATA if skip_not_data else 0) |
+                                       (MSF_VALIDATECRC if validate_crc else 0))
         self.verbose = ct.c_int8(verbose)
 
-        if unpack_data:
-            self.parse_flags.value |= MSF_UNPACKDATA.value
-
-        if skip_not_data:
-            self.parse_flags.value |= MSF_SKIPNOTDATA.value
-
-        if validate_crc:
-            self.parse_flags.value |= MSF_VALIDATECRC.value
-
-        self.ms3_readmsr_selection = wrap_function(clibmseed, 'ms3_readmsr_selection', ct.c_int,
-                                                   [ct.POINTER(ct.c_void_p),
-                                                    ct.POINTER(ct.c_void_p),
-                                                    ct.c_char_p, ct.c_uint32, ct.c_void_p, ct.c_int8])
-
-        self.ms3_mstl_init_fd = wrap_function(clibmseed, 'ms3_mstl_init_fd', ct.c_void_p,
-                                              [ct.c_int])
-
         # If the stream is an integer, assume an open file descriptor
         if isinstance(input, int):
             if sys.platform.lower().startswith("win"):
                 raise NotImplementedError('File descriptor support not implemented on Windows')
 
-            self._msfp = ct.c_void_p(self.ms3_mstl_init_fd(input))
+            # Hint that the descriptor will be read sequentially, ignored for pipes
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(input, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+
+            self._msfp = ct.c_void_p(_ms3_mstl_init_fd(input))
             self.stream_name = bytes(f'File Descriptor {input}', 'utf-8')
 
             if self._msfp is None:
@@ -65,33 +112,32 @@ class MS3RecordReader():
         else:
             self.stream_name = bytes(input, 'utf-8')
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.close()
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        next = self.read()
-        if next is not None:
-            return next
-        else:
-            raise StopIteration
+        # Persistent references to the file and record pointers for each read
+        self._msfp_ref = ct.byref(self._msfp)
+        self._msr_ref = ct.byref(self._msr)
 
     def read(self) -> MS3Record:
-        status = self.ms3_readmsr_selection(ct.byref(self._msfp), ct.byref(self._msr),
-                                            self.stream_name, self.parse_flags, self._selections, self.verbose)
+        status = _ms3_readmsr_selection(self._msfp_ref, self._msr_ref,
+                                        self.stream_name, self.parse_flags, self._selections, self.verbose)
 
         if status == MS_NOERROR:
-            return ct.cast(self._msr, ct.POINTER(MS3Record)).contents
+            return self._record()
         elif status == MS_ENDOFFILE:
             return None
         else:
             raise MseedLibError(status, f'Error reading miniSEED record')
 
     def close(self) -> None:
-        self.ms3_readmsr_selection(ct.byref(self._msfp), ct.byref(self._msr),
-                                   None, self.parse_flags, self._selections, self.verbose)
+        _ms3_readmsr_selection(self._msfp_ref, self._msr_ref,
+                               None, self.parse_flags, self._selections, self.verbose)
+        self._msrecord = None
+
+
+# Module-level C-function wrappers
+_ms3_readmsr_selection = wrap_function(clibmseed, 'ms3_readmsr_selection', ct.c_int,
+                                       [ct.POINTER(ct.c_void_p),
+                                        ct.POINTER(ct.c_void_p),
+                                        ct.c_char_p, ct.c_uint32, ct.c_void_p, ct.c_int8])
+
+_ms3_mstl_init_fd = wrap_function(clibmseed, 'ms3_mstl_init_fd', ct.c_void_p,
+                                  [ct.c_int])
@@ -2,8 +2,9 @@ import ctypes as ct
 from typing import Any
 from .clib import clibmseed, wrap_function
 from .definitions import *
-from .msrecord import MS3Record
-from .util import ms_nstime2timestr, ms_encoding_sizetype
+from .msrecord import MS3Record, _RECORD_HANDLER
+from .util import (ms_encoding_sizetype, _nstime2str, _sample_array, _np_view, _import_numpy,
+                   _SAMPLETYPE_CTYPE, _SAMPLETYPE_NPDTYPE)
 from .exceptions import *
 
 
@@ -17,11 +18,8 @@ class MS3RecordPtr(ct.Structure):
 
     @property
     def msr(self) -> MS3Record:
-        '''Return a constructed MS3Record'''
-        if not hasattr(self, '_msrecord'):
-            self._msrecord = self._msr.contents
-
-        return self._msrecord
+        '''Return the MS3Record for this record pointer'''
+        return self._msr.contents
 
 
 MS3RecordPtr._fields_ = [('bufferptr', ct.c_char_p),
@@ -45,8 +43,9 @@ class MS3RecordList(ct.Structure):
         '''Return the records via a generator iterator'''
         current_record = self._first
         while current_record:
-            yield current_record.contents
-            current_record = current_record.contents._next
+            record = current_record.contents
+            yield record
+            current_record = record._next
 
 
 MS3RecordList._fields_ = [('recordcnt', ct.c_uint64),
@@ -72,11 +71,7 @@ class MS3TraceSeg(ct.Structure):
         return self.starttime / NSTMODULUS
 
     def starttime_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self.starttime, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self.starttime, timeformat, subsecond)
 
     @property
     def endtime_seconds(self) -> float:
@@ -84,16 +79,12 @@ class MS3TraceSeg(ct.Structure):
         return self.endtime / NSTMODULUS
 
     def endtime_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self.endtime, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self.endtime, timeformat, subsecond)
 
     @property
     def recordlist(self) -> MS3RecordList:
         '''Return the record list structure'''
-        if self._recordlist is None:
+        if not self._recordlist:
             raise ValueError("No record list available")
 
         return self._recordlist.contents
@@ -109,34 +100,33 @@ class MS3TraceSeg(ct.Structure):
 
             data_samples = MS3TraceSeg.datasamples[:]
 
-        The array can efficiently be copied to a _numpy array_ using:
-
-            # Translate libmseed sample type to numpy type
-            nptype = {'i': numpy.int32, 'f': numpy.float32, 'd': numpy.float64, 't': numpy.char}
-
-            numpy.frombuffer(MS3TraceSeg.datasamples, dtype=nptype[MS3TraceSeg.sampletype])
+        A zero-copy _numpy array_ of the samples is available as
+        `MS3TraceSeg.np_datasamples`.
 
         *NOTE* These data are owned by the this object instance and will be freed
         when the instance is destroyed.  If you wish to keep the data, you must
         make a copy.
         '''
-        if self.numsamples <= 0:
+        numsamples = self.numsamples
+        if numsamples <= 0:
             raise ValueError("No decoded samples available")
 
-        if self.sampletype == 'i':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_int32 * self.numsamples)).contents
-        elif self.sampletype == 'f':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_float * self.numsamples)).contents
-        elif self.sampletype == 'd':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_double * self.numsamples)).contents
-        elif self.sampletype == 't':
-            return ct.cast(self._datasamples,
-                           ct.POINTER(ct.c_char * self.numsamples)).contents
-        else:
-            raise ValueError(f"Unknown sample type: {self.sampletype}")
+        sampletype = self.sampletype
+        try:
+            ctype = _SAMPLETYPE_CTYPE[sampletype]
+        except KeyError:
+            raise ValueError(f"Unknown sample type: {sampletype}")
+
+        return (ctype * numsamples).from_address(self._datasamples)
+
+    @property
+    def np_datasamples(self) -> Any:
+        '''Return data samples as a read-only numpy view of `MS3TraceSeg.datasamples`
+
+        NumPy is required for this property.  The view shares the memory of
+        `MS3TraceSeg.datasamples` and is subject to the same lifetime.
+        '''
+        return _np_view(self.datasamples, self.sampletype, 'MS3TraceSeg.np_datasamples')
 
     @property
     def sampletype(self) -> str:
@@ -152,11 +142,12 @@ class MS3TraceSeg(ct.Structure):
         sample_size = ct.c_uint8(0)
         sample_type = ct.c_char(0)
 
-        if self.recordlist is None:
+        if not self._recordlist:
             raise ValueError("No record list available to determine sample size and type")
 
         # Determine sample size and type from the first record in the list
-        status = ms_encoding_sizetype(self.recordlist._first.contents._msr.contents.encoding,
+        encoding = self._recordlist.contents._first.contents._msr.contents._encoding
+        status = ms_encoding_sizetype(encoding,
                                       ct.byref(sample_size),
                                       ct.byref(sample_type))
 
@@ -192,6 +183,37 @@ class MS3TraceSeg(ct.Structure):
         else:
             return status
 
+    def np_unpack_recordlist(self, out=None, verbose=0) -> Any:
+        '''Unpack the data samples from the record list into a numpy array
+
+        If `out` is provided, it must be a C-contiguous numpy array of the type
+        reported by `MS3TraceSeg.sample_size_type` with space for at least
+        `MS3TraceSeg.samplecnt` samples, e.g. a slice of a larger array re-used
+        across segments.  Otherwise a new array is allocated.
+
+        The samples are written directly into the array, which is owned by the
+        caller.  NumPy is required for this method.
+
+        Returns a view of the array containing the unpacked samples.
+        '''
+        np = _import_numpy('MS3TraceSeg.np_unpack_recordlist()')
+
+        (sample_size, sample_type) = self.sample_size_type
+        dtype = np.dtype(_SAMPLETYPE_NPDTYPE[sample_type])
+
+        if out is None:
+            out = np.empty(self.samplecnt, dtype=dtype)
+        elif out.dtype != dtype:
+            raise ValueError(f'Array type {out.dtype} does not match sample type {dtype}')
+        elif not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError('Array must be C-contiguous and writeable')
+
+        unpacked = self.unpack_recordlist(buffer_pointer=out.ctypes.data,
+                                          buffer_bytes=out.nbytes,
+                                          verbose=verbose)
+
+        return out[:unpacked]
+
 
 MS3TraceSeg._fields_ = [('starttime',    ct.c_int64),   # Time of first sample
                         ('endtime',      ct.c_int64),   # Time of last sample
@@ -219,12 +241,40 @@ class MS3TraceID(ct.Structure):
 
     def segments(self) -> Any:
         '''Return the trace segment structures via a generator iterator'''
+        traceid_address = ct.addressof(self)
         current_segment = self._first
         while current_segment:
+            segment = current_segment.contents
             # Set the `prvtptr` to the address of this trace ID
-            current_segment.contents._prvtptr = ct.addressof(self)
-            yield current_segment.contents
-            current_segment = current_segment.contents._next
+            segment._prvtptr = traceid_address
+            yield segment
+            current_segment = segment._next
+
+    def np_unpack_recordlist(self, verbose=0) -> Any:
+        '''Unpack the data samples from all segments into a single numpy array
+
+        One array is allocated for the total sample count of all segments and
+        each segment is unpacked directly into its slice, in segment order.
+        All segments must have the same sample type.  NumPy is required for
+        this method.
+
+        Returns a view of the array containing the unpacked samples.
+        '''
+        np = _import_numpy('MS3TraceID.np_unpack_recordlist()')
+
+        segments = list(self.segments())
+        if not segments:
+            raise ValueError("No trace segments available to unpack")
+
+        (sample_size, sample_type) = segments[0].sample_size_type
+        out = np.empty(sum(segment.samplecnt for segment in segments),
+                       dtype=_SAMPLETYPE_NPDTYPE[sample_type])
+
+        offset = 0
+        for segment in segments:
+            offset += len(segment.np_unpack_recordlist(out=out[offset:], verbose=verbose))
+
+        return out[:offset]
 
     @property
     def sourceid(self) -> str:
@@ -236,11 +286,7 @@ class MS3TraceID(ct.Structure):
         return self.earliest / NSTMODULUS
 
     def earliest_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self.earliest, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self.earliest, timeformat, subsecond)
 
     @property
     def latest_seconds(self) -> float:
@@ -248,11 +294,7 @@ class MS3TraceID(ct.Structure):
         return self.latest / NSTMODULUS
 
     def latest_str(self, timeformat=TimeFormat.ISOMONTHDAY_Z, subsecond=SubSecond.NANO_MICRO_NONE) -> str:
-        c_timestr = ct.create_string_buffer(40)
-
-        ms_nstime2timestr(self.latest, c_timestr, timeformat, subsecond)
-
-        return str(c_timestr.value, 'utf-8')
+        return _nstime2str(self.latest, timeformat, subsecond)
 
 
 MS3TraceID._fields_ = [('sid',         ct.c_char * LM_SIDLEN),  # Source identifier
@@ -341,13 +383,13 @@ class MSTraceList():
                            split_version=split_version, verbose=verbose)
 
     def __repr__(self) -> str:
-        repr = f'Trace List with {self.numtraceids} Source IDs\n'
+        lines = [f'Trace List with {self.numtraceids} Source IDs\n']
         for traceid in self.traceids():
-            repr += f'  {traceid}\n'
+            lines.append(f'  {traceid}\n')
             for segment in traceid.segments():
-                repr += f'    {segment}\n'
+                lines.append(f'    {segment}\n')
 
-        return repr
+        return ''.join(lines)
 
     def __del__(self) -> None:
         '''Free memory allocated at the C level for this MSTraceList'''
@@ -371,15 +413,13 @@ class MSTraceList():
         '''Return the trace ID structures via a generator iterator'''
         current_traceid = self._mstl.contents._traces._next[0]
         while current_traceid:
-            yield current_traceid.contents
-            current_traceid = current_traceid.contents._next[0]
+            traceid = current_traceid.contents
+            yield traceid
+            current_traceid = traceid._next[0]
 
     def sourceids(self) -> Any:
         '''Return the list of source IDs'''
-        sources = []
-        for traceid in self.traceids():
-            sources.append(traceid.sourceid)
-        return sources
+        return [traceid.sourceid for traceid in self.traceids()]
 
     def print(self, details=0, gaps=False, versions=False,
               timeformat=TimeFormat.ISOMONTHDAY_Z) -> None:
@@ -398,19 +438,10 @@ class MSTraceList():
         self._filenames.append(bytes(file_name, 'utf-8'))
         file_name_bytes = self._filenames[-1]
 
-        self.parse_flags.value = 0
-
-        if unpack_data:
-            self.parse_flags.value |= MSF_UNPACKDATA.value
-
-        if record_list:
-            self.parse_flags.value |= MSF_RECORDLIST.value
-
-        if skip_not_data:
-            self.parse_flags.value |= MSF_SKIPNOTDATA.value
-
-        if validate_crc:
-            self.parse_flags.value |= MSF_VALIDATECRC.value
+        self.parse_flags.value = ((MSF_UNPACKDATA if unpack_data else 0) |
+                                  (MSF_RECORDLIST if record_list else 0) |
+                                  (MSF_SKIPNOTDATA if skip_not_data else 0) |
+                                  (MSF_VALIDATECRC if validate_crc else 0))
 
         status = _ms3_readtracelist_selection(ct.byref(self._mstl), file_name_bytes,
                                               self._tolerance, self._selections,
@@ -437,7 +468,9 @@ class MSTraceList():
 
         The `sourceid` argument should be a valid FDSN source ID.
 
-        The `data_samples` argument should be a list of values to add.
+        The `data_samples` argument should be a list of values to add.  Buffers
+        of matching native type, e.g. array.array('i') or a numpy int32 array
+        for sample type 'i', are added without per-sample conversion.
 
         The start time, or time of the first sample, can be specified in one
         of three ways, used in this order of preference:
@@ -464,23 +497,13 @@ class MSTraceList():
         else:
             raise ValueError('Must specify either start_time, start_time_seconds or start_time_str')
 
+        # Create an appropriate ctypes array of the data samples
+        ctypes_data = _sample_array(data_samples, sample_type)
+
         msr._sampletype = sample_type.encode(encoding='utf-8')
-        msr._numsamples = len(data_samples)
+        msr._numsamples = len(ctypes_data)
         msr._samplecnt = msr._numsamples
-
-        # Create an appropriate ctypes array of the data samples
-        if sample_type == 'i':
-            msr._datasamples = ct.cast((ct.c_int32 * msr._numsamples)(*data_samples),
-                                       ct.c_void_p)
-        elif sample_type == 'f':
-            msr._datasamples = ct.cast((ct.c_float * msr._numsamples)(*data_samples),
-                                       ct.c_void_p)
-        elif sample_type == 'd':
-            msr._datasamples = ct.cast((ct.c_double * msr._numsamples)(*data_samples),
-                                       ct.c_void_p)
-        elif sample_type == 't':
-            msr._datasamples = ct.cast((ct.c_char * msr._numsamples)(*data_samples),
-                                       ct.c_void_p)
+        msr._datasamples = ct.cast(ct.byref(ctypes_data), ct.c_void_p)
 
         # Add the MS3Record to the trace list, setting auto-heal flag to 1 (true)
         seg = _mstl3_addmsr_recordptr(self._mstl, ct.byref(msr), None, 0, 1, 0, None)
@@ -492,9 +515,9 @@ class MSTraceList():
         '''Callback function for mstl3_pack()
         Ignore the handlerdata argument, which is passed at the Python level.
 
-        Cast the record buffer to a ctypes array for use in Python and pass to handler.
+        Map the record buffer address to a ctypes array for use in Python and pass to handler.
         '''
-        self._record_handler(ct.cast(record, ct.POINTER((ct.c_char * record_length))).contents,
+        self._record_handler((ct.c_char * record_length).from_address(record),
                              self._record_handler_data)
 
     def pack(self, handler, handlerdata=None, flush_data=True,
@@ -508,7 +531,17 @@ class MSTraceList():
                 handlerdata:    The `handlerdata` value
 
         The handler function must use or copy the record buffer as the memory may be
-        reused on subsequent iterations.
+        reused on subsequent iterations.  The record is a ctypes array that supports
+        the buffer protocol, so it can be passed directly to `file.write()`,
+        `memoryview()` or `numpy.frombuffer()` without first copying it to `bytes`.
+
+        The `handler` may also be a ctypes function pointer of the prototype
+        `ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)`,
+        e.g. created from the address of a natively compiled function, in which
+        case it is called directly by the library as
+        `handler(record, record_length, handlerdata)` without the Python-level
+        wrapper.  The `handlerdata` must then be None, an integer
+        address or a ctypes pointer.
 
         If `flush_data` is True, all data samples will be packed.  In the case of
         miniSEED format version 2, this will likely create unfilled final records.
@@ -535,29 +568,34 @@ class MSTraceList():
         Returns a tuple of (packed_samples, packed_records)
         '''
 
-        # Set handler function as ctypes callback function
-        if not hasattr(self, '_record_handler') or (self._record_handler != handler):
-            self._record_handler = handler
-
-            RECORD_HANDLER = ct.CFUNCTYPE(None, ct.POINTER(ct.c_char), ct.c_int, ct.c_void_p)
-            self._ctypes_record_handler = RECORD_HANDLER(self._record_handler_wrapper)
+        # Pass ctypes function pointers directly to the library
+        if isinstance(handler, _RECORD_HANDLER):
+            c_handler = handler
+            c_handlerdata = handlerdata
+        else:
+            # Create the ctypes callback once, it dispatches to the current handler
+            if not hasattr(self, '_ctypes_record_handler'):
+                self._ctypes_record_handler = _RECORD_HANDLER(self._record_handler_wrapper)
 
-        self._record_handler_data = handlerdata
+            self._record_handler = handler
+            self._record_handler_data = handlerdata
+            c_handler = self._ctypes_record_handler
+            c_handlerdata = None
 
-        pack_flags = ct.c_uint32(0)
+        pack_flags = 0
         packed_samples = ct.c_int64(0)
 
         if flush_data:
-            pack_flags.value |= MSF_FLUSHDATA.value
+            pack_flags |= MSF_FLUSHDATA
 
         if format_version is not None:
             if format_version not in [2, 3]:
                 raise ValueError(f'Invalid miniSEED format version: {format_version}')
 
             if format_version == 2:
-                pack_flags.value |= MSF_PACKVER2.value
+                pack_flags |= MSF_PACKVER2
 
-        packed_records = _mstl3_pack(self._mstl, self._ctypes_record_handler, None,
+        packed_records = _mstl3_pack(self._mstl, c_handler, c_handlerdata,
                                      record_length, encoding, ct.byref(packed_samples),
                                      pack_flags, verbose,
                                      extra_headers.encode('utf-8') if extra_headers else None)
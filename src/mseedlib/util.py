@@ -1,8 +1,12 @@
+import sys
+import threading
+import functools
 import ctypes as ct
 from .clib import clibmseed, wrap_function
 from .definitions import *
 
-ms_nstime2timestr = wrap_function(clibmseed, 'ms_nstime2timestr', ct.c_int,
+# Returns a pointer to the time string buffer, or NULL (None) on error
+ms_nstime2timestr = wrap_function(clibmseed, 'ms_nstime2timestr', ct.c_void_p,
                                   [ct.c_int64, ct.c_char_p, ct.c_int, ct.c_int])
 
 ms_timestr2nstime = wrap_function(clibmseed, 'ms_timestr2nstime', ct.c_int64,
@@ -28,16 +32,129 @@ ms_sampletime = wrap_function(clibmseed, 'ms_sampletime', ct.c_int64,
                               [ct.c_int64, ct.c_int64, ct.c_double])
 
 
+# NumPy module, imported on first use by the np_* methods
+_numpy = None
+
+
+def _import_numpy(feature: str):
+    '''Return the numpy module, raising ImportError naming `feature` if unavailable'''
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(f"NumPy is required for {feature}")
+        _numpy = numpy
+    return _numpy
+
+
+# Per-thread scratch buffers re-used across calls
+_thread_local = threading.local()
+
+# Buffer sizes, including the terminating NULL, for time strings, NSLC codes and source IDs
+_TIMESTR_BUFLEN = 40
+_NSLC_BUFLEN = 11
+_SID_BUFLEN = LM_SIDLEN + 1
+
+
+def _timestr_buffer():
+    '''Return a thread-local buffer for use with ms_nstime2timestr()'''
+    try:
+        return _thread_local.timestr
+    except AttributeError:
+        _thread_local.timestr = ct.create_string_buffer(_TIMESTR_BUFLEN)
+        return _thread_local.timestr
+
+
+def _nstime2str(nstime: int, timeformat, subsecond) -> str:
+    '''Format a nanosecond time with ms_nstime2timestr() in the thread-local buffer
+
+    An empty string is returned if the time cannot be formatted.
+    '''
+    c_timestr = _timestr_buffer()
+
+    if ms_nstime2timestr(nstime, c_timestr, timeformat, subsecond) is None:
+        return ''
+
+    return str(c_timestr.value, 'utf-8')
+
+
+def _nslc_buffers():
+    '''Return a thread-local buffer and its four 11-byte views for ms_sid2nslc()'''
+    try:
+        return _thread_local.nslc
+    except AttributeError:
+        buffer = (ct.c_char * (4 * _NSLC_BUFLEN))()
+        views = tuple((ct.c_char * _NSLC_BUFLEN).from_buffer(buffer, offset)
+                      for offset in range(0, 4 * _NSLC_BUFLEN, _NSLC_BUFLEN))
+        _thread_local.nslc = (buffer, views)
+        return _thread_local.nslc
+
+
+def _sourceid_buffer():
+    '''Return a thread-local buffer for use with ms_nslc2sid()'''
+    try:
+        return _thread_local.sourceid
+    except AttributeError:
+        _thread_local.sourceid = ct.create_string_buffer(_SID_BUFLEN)
+        return _thread_local.sourceid
+
+
+# ctypes types and compatible buffer format characters for sample type codes
+_SAMPLETYPE_CTYPE = {'i': ct.c_int32, 'f': ct.c_float, 'd': ct.c_double, 't': ct.c_char}
+_SAMPLETYPE_FORMATS = {'i': 'il', 'f': 'f', 'd': 'd', 't': 'cbB'}
+
+# NumPy data types for sample type codes
+_SAMPLETYPE_NPDTYPE = {'i': 'int32', 'f': 'float32', 'd': 'float64', 't': 'S1'}
+_NATIVE_BYTEORDER = '@=<' if sys.byteorder == 'little' else '@=>'
+
+
+def _np_view(samples, sampletype: str, feature: str):
+    '''Return a read-only numpy view of a ctypes sample array, without copying'''
+    np = _import_numpy(feature)
+
+    view = np.frombuffer(samples, dtype=_SAMPLETYPE_NPDTYPE[sampletype])
+    view.flags.writeable = False
+
+    return view
+
+
+def _sample_array(datasamples, sampletype: str):
+    '''Return a ctypes array of `sampletype` containing `datasamples`
+
+    Contiguous buffers of native samples, e.g. array.array or numpy arrays,
+    are used in place when writable and copied in bulk otherwise.  Any other
+    sequence is converted sample by sample.
+    '''
+    try:
+        ctype = _SAMPLETYPE_CTYPE[sampletype]
+    except KeyError:
+        raise ValueError(f"Unknown sample type: {sampletype}")
+
+    try:
+        view = memoryview(datasamples)
+    except TypeError:
+        view = None
+
+    if (view is not None and view.ndim == 1 and view.c_contiguous and
+            view.itemsize == ct.sizeof(ctype) and
+            view.format.lstrip(_NATIVE_BYTEORDER) in _SAMPLETYPE_FORMATS[sampletype]):
+        if view.readonly:
+            return (ctype * len(view)).from_buffer_copy(view)
+        else:
+            return (ctype * len(view)).from_buffer(view)
+
+    return (ctype * len(datasamples))(*datasamples)
+
+
 def nstime2timestr(nstime: int,
                    timeformat=TimeFormat.ISOMONTHDAY_Z,
                    subsecond=SubSecond.NANO_MICRO_NONE):
     """Convert a nanosecond timestamp to a date-time string"""
-    c_timestr = ct.create_string_buffer(40)
-
-    status = ms_nstime2timestr(nstime, c_timestr, timeformat, subsecond)
+    timestr = _nstime2str(nstime, timeformat, subsecond)
 
-    if status is not None:
-        return str(c_timestr.value, 'utf-8')
+    if timestr:
+        return timestr
     else:
         raise ValueError(f"Error converting timestamp: {nstime}")
 
@@ -50,12 +167,14 @@ def timestr2nstime(timestr: str) -> int:
     else:
         raise ValueError(f"Error converting date-time string: {timestr}")
 
+@functools.lru_cache(maxsize=4096)
 def sourceid2nslc(sourceid: str) -> tuple:
-    """Convert an FDSN source ID to a tuple of (net, sta, loc, chan)"""
-    net = ct.create_string_buffer(11)
-    sta = ct.create_string_buffer(11)
-    loc = ct.create_string_buffer(11)
-    chan = ct.create_string_buffer(11)
+    """Convert an FDSN source ID to a tuple of (net, sta, loc, chan)
+
+    Results are cached, source IDs usually repeat for every record of a stream.
+    """
+    buffer, (net, sta, loc, chan) = _nslc_buffers()
+    ct.memset(buffer, 0, ct.sizeof(buffer))
 
     status = ms_sid2nslc(sourceid.encode(), net, sta, loc, chan)
 
@@ -65,12 +184,15 @@ def sourceid2nslc(sourceid: str) -> tuple:
         raise ValueError("Invalid source ID: %s" % sourceid)
 
 
+@functools.lru_cache(maxsize=4096)
 def nslc2sourceid(net: str, sta: str, loc: str, chan: str) -> str:
-    """Convert network, station, location, channel codes to an FDSN source ID"""
-    #sourceid = ct.create_string_buffer(LM_SIDLEN + 1)
-    sourceid = ct.create_string_buffer(21)
+    """Convert network, station, location, channel codes to an FDSN source ID
+
+    Results are cached, codes usually repeat for every record of a stream.
+    """
+    sourceid = _sourceid_buffer()
 
-    status = ms_nslc2sid(sourceid, LM_SIDLEN + 1, 0,
+    status = ms_nslc2sid(sourceid, _SID_BUFLEN, 0,
                          net.encode(),
                          sta.encode(),
                          loc.encode(),
@@ -2,6 +2,7 @@ import pytest
 import os
 import json
 import math
+import array
 import ctypes as ct
 from mseedlib import MS3Record, DataEncoding
 
@@ -10,10 +11,10 @@ test_pack3 = os.path.join(test_dir, 'data', 'packtest_sine500.mseed3')
 test_pack2 = os.path.join(test_dir, 'data', 'packtest_sine500.mseed2')
 
 # A sine wave of 500 samples
-sine_500 = list(map(lambda x: int(math.sin(math.radians(x)) * 500), range(0, 500)))
+sine_500 = array.array('i', map(lambda x: int(math.sin(math.radians(x)) * 500), range(0, 500)))
 
 # A global record buffer
-record_buffer = b''
+record_buffer = bytearray()
 
 
 def record_handler(record, handler_data):
@@ -21,8 +22,7 @@ def record_handler(record, handler_data):
     Stores the record in a global buffer for testing
     '''
     print("Record handler called, record length: %d" % len(record))
-    global record_buffer
-    record_buffer = bytes(record)
+    record_buffer[:] = record
 
 
 def test_msrecord_pack():
@@ -32,7 +32,7 @@ def test_msrecord_pack():
     msr.reclen = 512
     msr.sourceid = "FDSN:XX_TEST__B_S_X"
     msr.formatversion = 3
-    msr.flags = ct.c_uint8(0x04).value  # Set the 4th bit (clock locked) to 1
+    msr.flags = 0x04  # Set bit 2 (clock locked) to 1
     msr.set_starttime_str("2023-01-02T01:02:03.123456789Z")
     msr.samprate = 50.0
     msr.encoding = DataEncoding.STEIM2  # value of 11
@@ -77,3 +77,27 @@ def test_msrecord_pack():
     with open(test_pack2, 'rb') as f:
         record_v2 = f.read()
         assert (record_buffer == record_v2)
+
+    # Test packing from a list of Python integers
+    (packed_samples, packed_records) = msr.pack(record_handler,
+                                                datasamples=sine_500.tolist(),
+                                                sampletype='i')
+
+    assert packed_samples == 500
+    assert packed_records == 1
+    assert (record_buffer == record_v2)
+
+    # Test packing with a ctypes function pointer called directly by the library
+    records = []
+
+    @ct.CFUNCTYPE(None, ct.c_void_p, ct.c_int, ct.c_void_p)
+    def c_record_handler(record, record_length, handlerdata):
+        records.append(ct.string_at(record, record_length))
+
+    (packed_samples, packed_records) = msr.pack(c_record_handler,
+                                                datasamples=sine_500,
+                                                sampletype='i')
+
+    assert packed_samples == 500
+    assert packed_records == 1
+    assert records == [record_v2]
@@ -1,5 +1,6 @@
 import pytest
 import os
+import mmap
 from mseedlib import MS3RecordBufferReader, DataEncoding, TimeFormat, SubSecond
 from mseedlib.exceptions import MseedLibError
 
@@ -55,6 +56,24 @@ def test_msrecord_read_buffer_details():
             assert data[-6:] == [-508722, -508764, -508809, -508866, -508927, -508986]
 
 
+def test_msrecord_read_buffer_numpy():
+    np = pytest.importorskip('numpy')
+
+    with open(test_path3, 'rb') as fp:
+        buffer = bytearray(fp.read())
+
+        with MS3RecordBufferReader(buffer, unpack_data=True) as msreader:
+
+            msr = msreader.read()
+
+            data = msr.np_datasamples
+
+            assert data.dtype == np.int32
+            assert len(data) == msr.numsamples
+            assert np.array_equal(data[0:6], [-502916, -502808, -502691, -502567, -502433, -502331])
+            assert np.array_equal(data[-6:], [-508722, -508764, -508809, -508866, -508927, -508986])
+
+
 def test_msrecord_read_buffer_summary():
     # Read data from test file into a buffer
     with open(test_path2, 'rb') as fp:
@@ -71,3 +90,67 @@ def test_msrecord_read_buffer_summary():
 
             assert record_count == 1141
             assert sample_count == 252000
+
+
+def test_msrecord_read_buffer_exhausted():
+    with open(test_path3, 'rb') as fp:
+        buffer = bytearray(fp.read())
+
+        with MS3RecordBufferReader(buffer) as msreader:
+            assert msreader.__length_hint__() > 0
+
+            record_count = sum(1 for _ in msreader)
+
+            assert record_count > 0
+
+            # Further iteration after the end of the buffer is a no-op
+            with pytest.raises(StopIteration):
+                next(msreader)
+
+
+def test_msrecord_read_buffer_growing():
+    with open(test_path3, 'rb') as fp:
+        data = fp.read()
+
+    # Start with the first record and part of the second
+    buffer = bytearray(data[:1000])
+
+    with MS3RecordBufferReader(buffer) as msreader:
+        assert msreader.read().reclen == 542
+
+        # Incomplete record at the end of the buffer
+        assert msreader.read() is None
+
+        # The source can be extended between reads
+        buffer.extend(data[1000:])
+
+        record_count = 1
+        while msreader.read() is not None:
+            record_count += 1
+
+    with MS3RecordBufferReader(bytearray(data)) as msreader:
+        assert record_count == sum(1 for _ in msreader)
+
+    # Iteration resumes after a partial trailing record once the source grows
+    buffer = bytearray(data[:1000])
+
+    with MS3RecordBufferReader(buffer) as msreader:
+        assert sum(1 for _ in msreader) == 1
+
+        buffer.extend(data[1000:])
+
+        assert sum(1 for _ in msreader) == record_count - 1
+
+
+def test_msrecord_read_buffer_mmap():
+    with open(test_path2, 'rb') as fp:
+        buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        with MS3RecordBufferReader(buffer) as msreader:
+            sample_count = sum(msr.samplecnt for msr in msreader)
+
+        assert sample_count == 252000
+        assert msreader.read() is None
+
+        # The source buffer is released when the reader is closed
+        buffer.close()
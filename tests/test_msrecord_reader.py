@@ -49,6 +49,28 @@ def test_msrecord_read_record_details():
         # Check last 6 samples
         assert data[-6:] == [-508722, -508764, -508809, -508866, -508927, -508986]
 
+        # Memoryview of data samples
+        view = msr.datasamples_view()
+
+        assert view.format == 'i'
+        assert len(view) == msr.numsamples
+        assert view[0:6].tolist() == [-502916, -502808, -502691, -502567, -502433, -502331]
+
+def test_msrecord_read_record_numpy():
+    np = pytest.importorskip('numpy')
+
+    with MS3RecordReader(test_path3, unpack_data=True) as msreader:
+
+        msr = msreader.read()
+
+        data = msr.np_datasamples
+
+        assert data.dtype == np.int32
+        assert len(data) == msr.numsamples
+        assert data.flags.writeable is False
+        assert data[0:6].tolist() == [-502916, -502808, -502691, -502567, -502433, -502331]
+        assert data[-6:].tolist() == [-508722, -508764, -508809, -508866, -508927, -508986]
+
 def test_msrecord_read_record_details_fd():
     # Open a file descriptor in python and provide the open stream to the reader
 
@@ -1,6 +1,9 @@
 import pytest
 import os
+import gc
 import math
+import array
+import ctypes as ct
 from mseedlib import MSTraceList, TimeFormat, SubSecond, timestr2nstime, sampletime, MseedLibError
 
 test_dir = os.path.abspath(os.path.dirname(__file__))
@@ -64,6 +67,25 @@ def test_tracelist_read():
     assert foundseg.datasamples[-6:] == [-165263, -162103, -159002, -155907, -152810, -149774]
 
 
+def test_tracelist_numpy():
+    np = pytest.importorskip('numpy')
+
+    mstl = MSTraceList(test_path3, unpack_data=True)
+
+    segment = next(mstl.get_traceid('FDSN:IU_COLA_00_B_H_Z').segments())
+
+    data = segment.np_datasamples
+
+    assert data.dtype == np.int32
+    assert len(data) == 84000
+
+    # Check first 6 samples
+    assert data[0:6].tolist() == [-231394, -231367, -231376, -231404, -231437, -231474]
+
+    # Check last 6 samples
+    assert data[-6:].tolist() == [-165263, -162103, -159002, -155907, -152810, -149774]
+
+
 def test_tracelist_read_recordlist():
     mstl = MSTraceList(test_path3, unpack_data=False, record_list=True)
 
@@ -78,6 +100,11 @@ def test_tracelist_read_recordlist():
 
     assert foundseg.numsamples == 0
 
+    records = list(foundseg.recordlist.records())
+
+    assert len(records) == foundseg.recordlist.recordcnt
+    assert records[0].msr.sourceid == 'FDSN:IU_COLA_00_B_H_Z'
+
     # Unpack data samples using in-place buffer
     foundseg.unpack_recordlist()
 
@@ -90,6 +117,49 @@ def test_tracelist_read_recordlist():
     assert foundseg.datasamples[-6:] == [-165263, -162103, -159002, -155907, -152810, -149774]
 
 
+def test_tracelist_recordlist_numpy():
+    np = pytest.importorskip('numpy')
+
+    mstl = MSTraceList(test_path3, unpack_data=False, record_list=True)
+
+    # Unpack all segments into slices of a single array
+    total_samples = sum(segment.samplecnt
+                        for traceid in mstl.traceids()
+                        for segment in traceid.segments())
+    samples = np.empty(total_samples, dtype=np.int32)
+
+    offset = 0
+    for traceid in mstl.traceids():
+        for segment in traceid.segments():
+            data = segment.np_unpack_recordlist(out=samples[offset:])
+            offset += len(data)
+
+    assert offset == 252000
+
+    # Last of the 3 channels is the Z component
+    assert samples[-84000:-83994].tolist() == [-231394, -231367, -231376, -231404, -231437, -231474]
+    assert samples[-6:].tolist() == [-165263, -162103, -159002, -155907, -152810, -149774]
+
+    # Unpack into a newly allocated array
+    foundseg = next(mstl.get_traceid('FDSN:IU_COLA_00_B_H_1').segments())
+    data = foundseg.np_unpack_recordlist()
+
+    assert data.dtype == np.int32
+    assert data[0:6].tolist() == [-502916, -502808, -502691, -502567, -502433, -502331]
+
+    with pytest.raises(ValueError):
+        foundseg.np_unpack_recordlist(out=np.empty(84000, dtype=np.float64))
+
+    # Unpack all segments of a trace ID into a single array
+    mstl = MSTraceList(test_path3, record_list=True)
+    data = mstl.get_traceid('FDSN:IU_COLA_00_B_H_Z').np_unpack_recordlist()
+
+    assert data.dtype == np.int32
+    assert len(data) == 84000
+    assert data[0:6].tolist() == [-231394, -231367, -231376, -231404, -231437, -231474]
+    assert data[-6:].tolist() == [-165263, -162103, -159002, -155907, -152810, -149774]
+
+
 # A sine wave generator
 def sine_generator(start_degree=0, yield_count=100, total=1000):
     '''A generator returning a continuing sequence for a sine values.'''
@@ -97,22 +167,24 @@ def sine_generator(start_degree=0, yield_count=100, total=1000):
     while generated < total:
         bite_size = min(yield_count, total - generated)
 
-        # Yield a tuple of 3 lists of continuing sine values
-        yield list(map(lambda x: int(math.sin(math.radians(x)) * 500),
-                       range(start_degree, start_degree + bite_size)))
+        # Yield an int32 array of continuing sine values
+        yield array.array('i', map(lambda x: int(math.sin(math.radians(x)) * 500),
+                                   range(start_degree, start_degree + bite_size)))
 
         start_degree += bite_size
         generated += bite_size
 
-# A global record buffer
-record_buffer = bytearray()
-
-def record_handler(record, handler_data):
-    '''A callback function for MSTraceList.set_record_handler()
-    Adds the record to a global buffer for testing
+class RecordSink:
+    '''A record handler for MSTraceList.pack()
+    Adds each record to a buffer for testing
     '''
-    global record_buffer
-    record_buffer.extend(bytes(record))
+    __slots__ = ('buffer',)
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def __call__(self, record, handler_data):
+        self.buffer.extend(record)
 
 test_pack3 = os.path.join(test_dir, 'data', 'packtest_sine2000.mseed3')
 
@@ -126,6 +198,7 @@ def test_mstracelist_pack():
     start_time = timestr2nstime("2024-01-01T15:13:55.123456789Z")
     format_version = 3
     record_length = 512
+    record_handler = RecordSink()
 
     for new_data in sine_generator(yield_count=100, total=2000):
 
@@ -155,7 +228,90 @@ def test_mstracelist_pack():
 
     with open(test_pack3, 'rb') as f:
         data_v3 = f.read()
-        assert (record_buffer == data_v3)
+        assert (record_handler.buffer == data_v3)
+
+
+def sine_tracelist(convert=None):
+    '''Return an MSTraceList populated with 2000 samples from sine_generator()
+
+    If `convert` is given, each batch is passed through it before add_data().
+    '''
+    mstl = MSTraceList()
+
+    sample_rate = 40.0
+    start_time = timestr2nstime("2024-01-01T15:13:55.123456789Z")
+
+    for new_data in sine_generator(yield_count=100, total=2000):
+        if convert is not None:
+            new_data = convert(new_data)
+
+        mstl.add_data(sourceid="FDSN:XX_TEST__B_S_X",
+                      data_samples=new_data, sample_type='i', sample_rate=sample_rate,
+                      start_time=start_time)
+
+        start_time = sampletime(start_time, len(new_data), sample_rate)
+
+    return mstl
+
+
+def test_mstracelist_pack_numpy():
+    np = pytest.importorskip('numpy')
+
+    # Add the samples from int32 numpy arrays, used without per-sample conversion
+    mstl = sine_tracelist(convert=lambda data: np.frombuffer(data, dtype=np.int32))
+
+    record_handler = RecordSink()
+    (packed_samples, packed_records) = mstl.pack(record_handler,
+                                                 format_version=3,
+                                                 record_length=512)
+
+    assert packed_samples == 2000
+    assert packed_records == 5
+
+    with open(test_pack3, 'rb') as f:
+        assert record_handler.buffer == f.read()
+
+
+def test_mstracelist_pack_cfunc():
+    mstl = sine_tracelist()
+
+    # A ctypes function pointer is called directly by the library
+    records = []
+
+    @ct.CFUNCTYPE(None, ct.c_void_p, ct.c_int, ct.c_void_p)
+    def c_record_handler(record, record_length, handlerdata):
+        records.append(ct.string_at(record, record_length))
+
+    (packed_samples, packed_records) = mstl.pack(c_record_handler,
+                                                 format_version=3,
+                                                 record_length=512)
+
+    assert packed_samples == 2000
+    assert packed_records == 5
+
+    with open(test_pack3, 'rb') as f:
+        assert b''.join(records) == f.read()
+
+
+def test_mstracelist_add_data_buffer_released():
+    batches = []
+
+    def keep_batch(data):
+        batches.append(data)
+        return data
+
+    # The buffer exports must be released when add_data returns, without cyclic GC
+    gc.disable()
+    try:
+        mstl = sine_tracelist(convert=keep_batch)
+
+        for data in batches:
+            data.append(0)
+    finally:
+        gc.enable()
+
+    assert len(batches) == 20
+    assert next(mstl.traceids()).numsegments == 1
 
 
 def test_mstracelist_nosuchfile():